@@ -1,20 +1,66 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.widgets import Button, Slider, RadioButtons
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import ttk
-import sys
 
-def polar_animator(polar_function, frames=200, interval=100, equation_str="r = f(θ)",
+# Numba cannot be deferred to first use because @njit runs at function
+# definition time, but the import is already optional
+try:
+    from numba import njit
+except ImportError:
+    # Numba is an optional accelerator; without it the evaluators run as
+    # plain NumPy functions, so fall back to a pass-through decorator
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+def _sample(fn, theta):
+    """
+    Evaluate a polar function on a full theta array.
+
+    Tries a single vectorized call first. User-supplied functions that only
+    accept scalars fall back to np.vectorize, whose C-level loop is still
+    faster than a Python list comprehension and returns an ndarray directly.
+
+    Parameters:
+    -----------
+    fn : function
+        Function that takes theta (in radians) and returns r
+    theta : ndarray
+        Angles to evaluate the function at
+
+    Returns:
+    --------
+    ndarray
+        r values with the same shape as theta
+    """
+    try:
+        result = np.asarray(fn(theta), dtype=float)
+    except (TypeError, ValueError):
+        return np.vectorize(fn, otypes=[float])(theta)
+    if result.shape != np.shape(theta):
+        # Scalar-only function that silently ignored the array input
+        return np.vectorize(fn, otypes=[float])(theta)
+    return result
+
+def polar_animator(fig, polar_function, frames=200, interval=100, equation_str="r = f(θ)",
                  coefficients=None):
     """
     Animate a polar function r = f(theta) by tracing a point along the curve.
-    
+
+    Renders into an existing figure so callers can reuse an embedded canvas
+    instead of paying for a new window and canvas per animation.
+
     Parameters:
     -----------
+    fig : matplotlib.figure.Figure
+        Figure to render the animation into; its current content is cleared
     polar_function : function
         Function that takes theta (in radians) and returns r
     frames : int
@@ -26,23 +72,27 @@ def polar_animator(polar_function, frames=200, interval=100, equation_str="r = f
     coefficients : dict or None
         Dictionary mapping coefficient names to their values
     """
-    # Create figure and polar axes
-    fig = plt.figure(figsize=(12, 10))
+    # Imported here rather than at module top so app startup does not pay
+    # for the animation machinery before the first animation runs
+    import matplotlib.animation as animation
+    from matplotlib.collections import LineCollection
+
+    # Reuse the caller's figure for the polar axes
+    fig.clear()
     # Use gridspec to position the plot with better margins, lower position, and more space for title
     gs = fig.add_gridspec(1, 1, left=0.25, right=0.95, top=0.75, bottom=0.05)
     ax = fig.add_subplot(gs[0, 0], projection='polar')
     
+    # Compute full curve for reference with a single vectorized evaluation
+    theta_full = np.linspace(0, 2*np.pi, 1000)
+    r_full = _sample(polar_function, theta_full)
+
     # Set axis limits - handle negative r values by using the absolute max
-    r_values = [polar_function(theta) for theta in np.linspace(0, 2*np.pi, 1000)]
-    ax.set_ylim(0, 1.1 * max(abs(min(r_values)), abs(max(r_values))))
-    
+    ax.set_ylim(0, 1.1 * np.nanmax(np.abs(r_full)))
+
     # Increase tick label font size
     ax.tick_params(axis='both', which='major', labelsize=12)
     
-    # Compute full curve for reference
-    theta_full = np.linspace(0, 2*np.pi, 1000)
-    r_full = [polar_function(t) for t in theta_full]
-    
     # Plot the full curve in light gray
     # For rose patterns and other functions with negative r values, 
     # we need to handle the sign correctly in polar coordinates
@@ -67,8 +117,13 @@ def polar_animator(polar_function, frames=200, interval=100, equation_str="r = f
     # Initialize opposite ray (180 degrees from main ray)
     opposite_ray, = ax.plot([0, 0], [0, max_r], '--', linewidth=1.0, alpha=0.5, color='navy')
     
-    # Initialize the rays collection to show continuous angles
-    rays_collection = []
+    # Persistent rays showing continuous angles, kept in a single
+    # LineCollection so blitting never sees new artists appear mid-animation.
+    # Segments are preallocated as one contiguous (theta, r) vertex buffer;
+    # a ray is added every 10 frames, so frames//10 slots suffice.
+    ray_segments = np.zeros(((frames + 9) // 10, 2, 2))
+    rays_lc = LineCollection([], colors='b', linewidths=0.5, alpha=0.2)
+    ax.add_collection(rays_lc)
     
     # Create a separate axes for text at the left side of the figure, adjusted for the lower graph
     text_ax = fig.add_axes([0.02, 0.05, 0.2, 0.75])
@@ -89,25 +144,54 @@ def polar_animator(polar_function, frames=200, interval=100, equation_str="r = f
     
     # Initialize curves drawn so far
     drawn_curve, = ax.plot([], [], 'b-', linewidth=2.5)
-    
+
+    # Precompute one r value per frame so animate() only slices arrays
+    # instead of re-evaluating the function every frame.
+    # In polar coordinates (θ, -r) is equivalent to (θ+π, r), so fold the
+    # negative-r branch into the precomputed plotting arrays as well.
+    theta_dense = np.linspace(0, 2*np.pi, frames + 1)
+    r_dense = _sample(polar_function, theta_dense)
+    plot_theta = np.where(r_dense >= 0, theta_dense, theta_dense + np.pi)
+    plot_r = np.abs(r_dense)
+
+    # Precompute the per-frame angle labels; they depend only on the frame
+    # index, so formatting them once here removes four float __format__ calls
+    # per frame from the hot path
+    angle_strings = [
+        f"θ = {t:.2f} rad = {d:.1f}°, r = {'+' if rv >= 0 else '-'}{abs(rv):.2f}"
+        for t, d, rv in zip(theta_dense, np.degrees(theta_dense), r_dense)
+    ]
+
+    # Artists that mutate during the animation; everything else (gridlines,
+    # reference curve, equation text) lives in the blit background
+    dynamic_coef_texts = []
+    if coefficients:
+        dynamic_coef_texts = [text_obj for name, text_obj in coef_texts
+                              if callable(coefficients[name])]
+    animated_artists = [line_trace, point, opposite_point, ray, opposite_ray,
+                        rays_lc, drawn_curve, angle_text] + dynamic_coef_texts
+    for artist in animated_artists:
+        artist.set_animated(True)
+
     def init():
-        line_trace.set_data([0, 0], [0, polar_function(0)])
-        point.set_data([0], [polar_function(0)])
+        line_trace.set_data([0, 0], [0, r_dense[0]])
+        point.set_data([0], [r_dense[0]])
         opposite_point.set_data([], [])  # Initially empty
         ray.set_data([0, 0], [0, max_r])
         opposite_ray.set_data([0, np.pi], [0, max_r])  # 180 degrees from main ray
         
         angle_text.set_text("")
         drawn_curve.set_data([], [])
-        
-        # Since we're not using blit, return value doesn't matter
-        return [line_trace, point, opposite_point, ray, opposite_ray, drawn_curve]
+        rays_lc.set_segments(ray_segments[:0])
+
+        # With blit enabled, return exactly the artists that mutate
+        return animated_artists
     
     def animate(i):
-        # Current angle
-        theta = 2 * np.pi * i / frames
-        r = polar_function(theta)
-        
+        # Current angle and radius come straight from the precomputed arrays
+        theta = theta_dense[i]
+        r = r_dense[i]
+
         # Update angle ray - always follows smooth rotation regardless of r value
         ray.set_data([0, theta], [0, max_r])
         
@@ -117,8 +201,8 @@ def polar_animator(polar_function, frames=200, interval=100, equation_str="r = f
         
         # Add a persistent ray at the current angle (with lower opacity)
         if i % 10 == 0:  # Add a ray every 10 frames to avoid too many lines
-            new_ray, = ax.plot([0, theta], [0, max_r], 'b-', linewidth=0.5, alpha=0.2)
-            rays_collection.append(new_ray)
+            ray_segments[i // 10] = [[0, 0], [theta, max_r]]
+            rays_lc.set_segments(ray_segments[:i // 10 + 1])
         
         # Update points - handle negative r values
         if r >= 0:
@@ -132,31 +216,13 @@ def polar_animator(polar_function, frames=200, interval=100, equation_str="r = f
             point.set_data([theta + np.pi], [abs(r)])
             opposite_point.set_data([theta], [0])
         
-        # Update angle text with r value sign indicator
-        r_sign = "+" if r >= 0 else "-"
-        angle_text.set_text(f"θ = {theta:.2f} rad = {np.degrees(theta):.1f}°, r = {r_sign}{abs(r):.2f}")
-        # Make sure font size is consistent
-        angle_text.set_fontsize(14)
-        
-        # Update drawn curve - handle negative r values properly
-        thetas = np.linspace(0, theta, 100)
-        rs = [polar_function(t) for t in thetas]
-        
-        # For functions with negative r values (like rose pattern)
-        # In polar coordinates, (θ, -r) is equivalent to (θ+π, r)
-        curve_thetas = []
-        curve_rs = []
-        
-        for t, r in zip(thetas, rs):
-            if r >= 0:
-                curve_thetas.append(t)
-                curve_rs.append(r)
-            else:
-                # Handle negative r values by adding π to θ and taking abs(r)
-                curve_thetas.append(t + np.pi)
-                curve_rs.append(abs(r))
-                
-        drawn_curve.set_data(curve_thetas, curve_rs)
+        # Update angle text from the precomputed per-frame labels; the font
+        # size set at creation persists, so never touch it here
+        angle_text.set_text(angle_strings[i])
+        
+        # Update drawn curve - a growing slice of the precomputed arrays,
+        # with negative r values already folded into (θ+π, |r|) form
+        drawn_curve.set_data(plot_theta[:i + 1], plot_r[:i + 1])
         
         # Update coefficient values if provided
         if coefficients:
@@ -165,43 +231,104 @@ def polar_animator(polar_function, frames=200, interval=100, equation_str="r = f
                 if callable(coefficients[name]):
                     current_value = coefficients[name](theta)
                     text_obj.set_text(f"{name} = {current_value:.3f}")
-                    text_obj.set_fontsize(14)  # Ensure consistent font size
         
-        # Include all elements in return
-        # Only return elements from the polar axes since we're not using blit mode
-        return [line_trace, point, opposite_point, ray, opposite_ray, drawn_curve]
-    
-    ani = animation.FuncAnimation(fig, animate, frames=frames, 
+        # Return every mutated artist so blit redraws only those regions
+        return animated_artists
+
+    ani = animation.FuncAnimation(fig, animate, frames=frames,
                                   init_func=init, interval=interval,
-                                  blit=False)  # Disable blit mode to avoid issues with text elements
+                                  blit=True)
     
     # Add title with left alignment and larger font, with increased padding
     ax.set_title(f"Animation of Polar Equation: {equation_str}", pad=40, loc='left', fontsize=16)
-    plt.grid(True)
-    
+    ax.grid(True)
+
     return ani
 
+# Coefficient-parameterized evaluators for the equation database.
+# Module-level (rather than closures over the coefficient dict) so Numba can
+# compile them; closures over Python locals cannot be jitted. Compiled lazily
+# per input type since they are called with both scalars and full theta arrays.
+
+@njit(cache=True, fastmath=True)
+def _circle_r(theta, a):
+    # Return an array matching theta so the function is safe to call on a
+    # full theta array in one vectorized evaluation
+    return np.full_like(np.asarray(theta, dtype=np.float64), a)
+
+@njit(cache=True, fastmath=True)
+def _cardioid_r(theta, a):
+    return a * (1 + np.cos(theta))
+
+@njit(cache=True, fastmath=True)
+def _rose_r(theta, a, n):
+    return a * np.cos(n * theta)
+
+@njit(cache=True, fastmath=True)
+def _spiral_r(theta, a):
+    return a * theta
+
+@njit(cache=True, fastmath=True)
+def _limacon_r(theta, a, b):
+    return a + b * np.cos(theta)
+
+def _build_vector_fn(name, coefs):
+    """
+    Build a vectorized r(theta) specialized for one equation.
+
+    Binds the coefficient values up front so the equation-name dispatch and
+    dict lookups happen once, not inside the evaluation hot path.
+
+    Parameters:
+    -----------
+    name : str
+        Equation name ("Circle", "Cardioid", "Rose", "Spiral" or "Limacon")
+    coefs : dict
+        Mapping of coefficient names to their current values
+
+    Returns:
+    --------
+    function
+        Function taking theta (scalar or ndarray) and returning r
+    """
+    if name == "Circle":
+        a = coefs["a"]
+        return lambda theta: _circle_r(theta, a)
+    elif name == "Cardioid":
+        a = coefs["a"]
+        return lambda theta: _cardioid_r(theta, a)
+    elif name == "Rose":
+        a, n = coefs["a"], coefs["n"]
+        return lambda theta: _rose_r(theta, a, n)
+    elif name == "Spiral":
+        a = coefs["a"]
+        return lambda theta: _spiral_r(theta, a)
+    elif name == "Limacon":
+        a, b = coefs["a"], coefs["b"]
+        return lambda theta: _limacon_r(theta, a, b)
+    raise ValueError(f"Unknown equation: {name}")
+
 # Example usage with different polar functions
 
 # Example 1: Circle with radius 2
 def circle(theta):
-    return 2
+    return _circle_r(theta, 2.0)
 
 # Example 2: Cardioid
 def cardioid(theta):
-    return 2 * (1 + np.cos(theta))
+    return _cardioid_r(theta, 2.0)
 
 # Example 3: Rose curve with 3 petals
 def rose(theta):
-    return 3 * np.cos(3 * theta)
+    return _rose_r(theta, 3.0, 3.0)
 
 # Example 4: Spiral
 def spiral(theta):
-    return 0.5 * theta
+    return _spiral_r(theta, 0.5)
 
 # Example 5: Limacon
 def limacon(theta):
-    return 2 + 1 * np.cos(theta)
+    return _limacon_r(theta, 2.0, 1.0)
 
 # Main application class
 class PolarEquationApp:
@@ -209,16 +336,17 @@ class PolarEquationApp:
         self.root = root
         self.root.title("Polar Equation Explorer")
         self.root.geometry("1400x800")
-        self.original_geometry = "1400x800"  # Store initial geometry
         self.animation = None
-        self.current_frame = None
         self.is_paused = False
+        # Pending after() id used to debounce slider-driven redraws
+        self._redraw_after_id = None
         
         # Create equation database
         self.equations = {
             "Circle": {
                 "function": circle,
                 "equation_str": "r = a",
+                "equation_template": "r = {a:.1f}",
                 "coefficients": {
                     "a": {"default": 2, "min": 0.1, "max": 5}
                 }
@@ -226,6 +354,7 @@ class PolarEquationApp:
             "Cardioid": {
                 "function": cardioid,
                 "equation_str": "r = a·(1 + cos(θ))",
+                "equation_template": "r = {a:.1f}·(1 + cos(θ))",
                 "coefficients": {
                     "a": {"default": 2, "min": 0.1, "max": 5}
                 }
@@ -233,6 +362,7 @@ class PolarEquationApp:
             "Rose": {
                 "function": rose,
                 "equation_str": "r = a·cos(nθ)",
+                "equation_template": "r = {a:.1f}·cos({n:.0f}θ)",
                 "coefficients": {
                     "a": {"default": 3, "min": 0.1, "max": 5},
                     "n": {"default": 3, "min": 1, "max": 10, "step": 1}
@@ -241,6 +371,7 @@ class PolarEquationApp:
             "Spiral": {
                 "function": spiral,
                 "equation_str": "r = a·θ",
+                "equation_template": "r = {a:.1f}·θ",
                 "coefficients": {
                     "a": {"default": 0.5, "min": 0.1, "max": 2}
                 }
@@ -248,6 +379,7 @@ class PolarEquationApp:
             "Limacon": {
                 "function": limacon,
                 "equation_str": "r = a + b·cos(θ)",
+                "equation_template": "r = {a:.1f} + {b:.1f}·cos(θ)",
                 "coefficients": {
                     "a": {"default": 2, "min": 0.1, "max": 5},
                     "b": {"default": 1, "min": 0.1, "max": 5}
@@ -314,9 +446,24 @@ class PolarEquationApp:
         # Create layout with more room for the polar plot
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.plot_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
+
+        # Create the polar axes and curve artist once; update_static_plot
+        # only updates their data afterwards
+        self.init_static_axes()
+
         # Initialize with the first equation
         self.on_equation_selected(None)
+
+    def init_static_axes(self):
+        """Create the polar axes and the reusable static-curve artist."""
+        # Create the polar axes with better positioning, shifted down, and more room for title
+        gs = self.fig.add_gridspec(1, 1, left=0.25, right=0.95, top=0.75, bottom=0.05)
+        self.ax = self.fig.add_subplot(gs[0, 0], projection='polar')
+
+        # Increase tick label font size
+        self.ax.tick_params(axis='both', which='major', labelsize=12)
+
+        self.static_line, = self.ax.plot([], [], 'b-')
         
     def on_equation_selected(self, event):
         # Clear previous sliders
@@ -368,8 +515,15 @@ class PolarEquationApp:
         
         # Update the displayed value
         self.sliders[name]["label"].config(text=f"{value:.2f}" if step != 1 else f"{value:d}")
-        
-        # Update the plot
+
+        # Debounce the redraw: ttk.Scale fires on every pixel of a drag, so
+        # coalesce bursts of events into one plot update 50 ms later
+        if self._redraw_after_id is not None:
+            self.root.after_cancel(self._redraw_after_id)
+        self._redraw_after_id = self.root.after(50, self._do_debounced_redraw)
+
+    def _do_debounced_redraw(self):
+        self._redraw_after_id = None
         self.update_static_plot()
         
     def toggle_pause(self):
@@ -394,9 +548,6 @@ class PolarEquationApp:
                     self.stop_animation()
     
     def update_static_plot(self):
-        # Clear the figure
-        self.fig.clear()
-        
         # Get the selected equation
         equation_name = self.equation_var.get()
         equation_data = self.equations[equation_name]
@@ -406,63 +557,33 @@ class PolarEquationApp:
         for name, slider_data in self.sliders.items():
             coef_values[name] = slider_data["var"].get()
         
-        # Create a function that uses the current coefficient values
-        def current_function(theta):
-            if equation_name == "Circle":
-                return coef_values["a"]
-            elif equation_name == "Cardioid":
-                return coef_values["a"] * (1 + np.cos(theta))
-            elif equation_name == "Rose":
-                return coef_values["a"] * np.cos(coef_values["n"] * theta)
-            elif equation_name == "Spiral":
-                return coef_values["a"] * theta
-            elif equation_name == "Limacon":
-                return coef_values["a"] + coef_values["b"] * np.cos(theta)
-            return 0
+        # Build a function specialized for the current coefficient values
+        current_function = _build_vector_fn(equation_name, coef_values)
         
-        # Create the polar axes with better positioning, shifted down, and more room for title
-        gs = self.fig.add_gridspec(1, 1, left=0.25, right=0.95, top=0.75, bottom=0.05)
-        ax = self.fig.add_subplot(gs[0, 0], projection='polar')
-        
-        # Plot the function
+        # Evaluate the function with a single vectorized call
         thetas = np.linspace(0, 2*np.pi, 1000)
-        rs = [current_function(t) for t in thetas]
-        
-        # Increase tick label font size
-        ax.tick_params(axis='both', which='major', labelsize=12)
-        
-        # Set limits and plot
-        ax.set_ylim(0, 1.1 * max(abs(min(rs)) if min(rs) < 0 else 0, max(rs)))
-        
-        # For rose patterns and other functions with negative r values
-        curve_thetas = []
-        curve_rs = []
-        
-        for t, r in zip(thetas, rs):
-            if r >= 0:
-                curve_thetas.append(t)
-                curve_rs.append(r)
-            else:
-                curve_thetas.append(t + np.pi)
-                curve_rs.append(abs(r))
-        
-        ax.plot(curve_thetas, curve_rs, 'b-')
-        
-        # Set the title
-        equation_str = equation_data["equation_str"]
-        for name, value in coef_values.items():
-            if name in equation_str:
-                # Replace coefficient in equation string
-                if isinstance(value, int):
-                    equation_str = equation_str.replace(name, str(value))
-                else:
-                    equation_str = equation_str.replace(name, f"{value:.1f}")
+        rs = np.asarray(current_function(thetas))
+
+        # Set limits on the cached axes with a single-pass ndarray reduction
+        # instead of three separate Python-level min/max/abs traversals
+        self.ax.set_ylim(0, 1.1 * np.abs(rs).max())
+
+        # For rose patterns and other functions with negative r values:
+        # (θ, -r) is equivalent to (θ+π, r), folded branchlessly with np.where
+        curve_thetas = np.where(rs >= 0, thetas, thetas + np.pi)
+        curve_rs = np.abs(rs)
+
+        self.static_line.set_data(curve_thetas, curve_rs)
         
+        # Set the title from the precomputed template in one format call
+        # instead of a per-coefficient substitution loop
+        equation_str = equation_data["equation_template"].format(**coef_values)
+
         # Add title to the polar axes with left alignment and larger font, with increased padding
-        ax.set_title(f"Polar Equation: {equation_str}", pad=40, loc='left', fontsize=16)
-        
-        # Update the canvas
-        self.canvas.draw()
+        self.ax.set_title(f"Polar Equation: {equation_str}", pad=40, loc='left', fontsize=16)
+
+        # Update the canvas without forcing a synchronous redraw
+        self.canvas.draw_idle()
     
     def start_animation(self):
         # Disable the controls
@@ -475,15 +596,13 @@ class PolarEquationApp:
             for child in widget.winfo_children():
                 if isinstance(child, ttk.Scale):
                     child["state"] = "disabled"
-        
-        # Hide the static plot and reduce window size
-        self.canvas.get_tk_widget().pack_forget()
-        self.plot_frame.pack_forget()
-        # Save original geometry for later restoration
-        self.original_geometry = self.root.geometry()
-        # Resize window to fit just the controls
-        self.root.geometry("400x500")
-        
+
+        # Drop any pending debounced static redraw; the static axes are about
+        # to be replaced by the animation axes
+        if self._redraw_after_id is not None:
+            self.root.after_cancel(self._redraw_after_id)
+            self._redraw_after_id = None
+
         # Get the selected equation
         equation_name = self.equation_var.get()
         equation_data = self.equations[equation_name]
@@ -493,25 +612,14 @@ class PolarEquationApp:
         for name, slider_data in self.sliders.items():
             coef_values[name] = slider_data["var"].get()
         
-        # Create a function that uses the current coefficient values
-        def current_function(theta):
-            if equation_name == "Circle":
-                return coef_values["a"]
-            elif equation_name == "Cardioid":
-                return coef_values["a"] * (1 + np.cos(theta))
-            elif equation_name == "Rose":
-                return coef_values["a"] * np.cos(coef_values["n"] * theta)
-            elif equation_name == "Spiral":
-                return coef_values["a"] * theta
-            elif equation_name == "Limacon":
-                return coef_values["a"] + coef_values["b"] * np.cos(theta)
-            return 0
+        # Build a function specialized for the current coefficient values
+        current_function = _build_vector_fn(equation_name, coef_values)
         
         # Create dynamic coefficients for display
         dynamic_coefs = {}
         for name, value in coef_values.items():
             dynamic_coefs[name] = value
-        dynamic_coefs["r"] = lambda theta: current_function(theta)
+        dynamic_coefs["r"] = current_function
         
         # Clear previous animation
         if self.animation and hasattr(self.animation, 'event_source') and self.animation.event_source is not None:
@@ -520,61 +628,19 @@ class PolarEquationApp:
             except Exception:
                 pass  # Ignore any errors stopping the animation
         
-        # Create the animation
+        # Create the animation in the embedded figure
         self.animation = polar_animator(
+            self.fig,
             current_function,
             frames=200,
             interval=100 - self.speed_var.get(),  # Higher value = slower animation
             equation_str=equation_data["equation_str"],
             coefficients=dynamic_coefs
         )
-        
-        # Store the current frame figure
-        self.current_frame = plt.gcf()
-        
-        # Add a close event handler to handle window being closed
-        try:
-            self.current_frame.canvas.mpl_connect('close_event', lambda event: self.handle_animation_close())
-        except Exception:
-            pass  # Ignore errors setting up the handler
-        
-        # Show the animation
-        plt.show(block=False)
-    
-    def handle_animation_close(self):
-        """Handle the animation window being closed by the user"""
-        # Only do something if animation is still active
-        if self.animation and hasattr(self.animation, 'event_source') and self.animation.event_source is not None:
-            # We don't need to close the window since the user already did
-            try:
-                self.animation.event_source.stop()
-            except Exception:
-                pass  # Ignore any errors stopping the animation
-            
-            self.animation = None
-            
-            # Re-enable the controls
-            self.equation_combo["state"] = "readonly"
-            self.start_button["state"] = "normal"
-            self.pause_button["state"] = "disabled"
-            self.stop_button["state"] = "disabled"
-            self.is_paused = False
-            for widget in self.sliders_frame.winfo_children():
-                for child in widget.winfo_children():
-                    if isinstance(child, ttk.Scale):
-                        child["state"] = "normal"
-            
-            # Update and show the static plot
-            self.update_static_plot()
-            
-            # Restore the plot frame and canvas
-            self.plot_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-            self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Restore original window size if available
-            if hasattr(self, 'original_geometry') and self.original_geometry:
-                self.root.geometry(self.original_geometry)
-    
+
+        # Show the animation on the embedded canvas
+        self.canvas.draw_idle()
+
     def stop_animation(self):
         # Stop the animation
         if self.animation and hasattr(self.animation, 'event_source') and self.animation.event_source is not None:
@@ -582,15 +648,14 @@ class PolarEquationApp:
                 self.animation.event_source.stop()
             except Exception:
                 pass  # Ignore any errors stopping the animation
-                
-            if self.current_frame:
-                try:
-                    plt.close(self.current_frame)
-                except Exception:
-                    pass  # Ignore any errors closing the figure
-                    
+
             self.animation = None
-        
+
+        # Rebuild the static axes in the same embedded figure the
+        # animation was rendered into
+        self.fig.clear()
+        self.init_static_axes()
+
         # Re-enable the controls
         self.equation_combo["state"] = "readonly"
         self.start_button["state"] = "normal"
@@ -601,17 +666,9 @@ class PolarEquationApp:
             for child in widget.winfo_children():
                 if isinstance(child, ttk.Scale):
                     child["state"] = "normal"
-        
+
         # Update and show the static plot
         self.update_static_plot()
-        
-        # Restore the plot frame and canvas
-        self.plot_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Restore original window size if available
-        if hasattr(self, 'original_geometry') and self.original_geometry:
-            self.root.geometry(self.original_geometry)
 
 # Start the application
 if __name__ == "__main__":